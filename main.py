@@ -1,18 +1,34 @@
 #!/usr/bin/env python3
 import os
-import json
+import queue
+import atexit
+import signal
+import sys
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from logging.handlers import RotatingFileHandler
+import orjson
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import requests
 from datetime import datetime
+from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from typing import Optional, Dict, Any
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional, Union
 
 class APIError(Exception):
     """Custom exception class for API errors."""
     pass
 
+def format_timestamp(value: Any) -> str:
+    """Render an activation log timestamp for display (epoch seconds, or a legacy ISO string)."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat(timespec="seconds")
+    return str(value)
+
 class SiriusXMClient:
     """
     Client to interact with SiriusXM API endpoints.
@@ -29,67 +45,136 @@ class SiriusXMClient:
     CREATE_ACCOUNT_ENDPOINT = "/services/DealerAppService3/CreateAccount"
     REFRESH_FOR_CC_ENDPOINT = "/services/USUpdateDeviceRefreshForCC/updateDeviceSATRefreshWithPriority"
     ORACLE_URL = "https://oemremarketing.custhelp.com/cgi-bin/oemremarketing.cfg/php/custom/src/oracle/program_status.php"
+    # None values drop the matching session-level headers, so the Oracle host only gets the
+    # session's User-Agent, Accept and Content-Type.
+    ORACLE_HEADERS: Dict[str, Optional[str]] = {
+        "Accept-Language": None,
+        "Accept-Encoding": None,
+        "X-Voltmx-API-Version": None,
+        "X-Voltmx-DeviceId": None,
+    }
     REQUEST_TIMEOUT = 10  # seconds
+    DEBUG_PREVIEW_BYTES = 1024  # response body prefix logged for fire-and-forget calls
+    DRAIN_CHUNK_BYTES = 64 * 1024  # read size used to discard fire-and-forget response bodies
+    ACTIVATION_LOG_FLUSH_EVERY = 5  # activations buffered before the log is written
+
+    # Pre-encoded form bodies. Static payloads are sent as-is; templates take
+    # quote_plus()-escaped values so requests does not re-run urlencode per call.
+    VERSION_CHECK_BODY = (b"deviceCategory=iPhone&appver=3.1.0&deviceLocale=en_US"
+                          b"&deviceModel=iPhone+6+Plus&deviceVersion=12.5.7&deviceType=")
+    SAT_REFRESH_BODY = ("deviceId=%s&appVersion=3.1.0&lng=-86.210313195&deviceID=%s"
+                        "&provisionPriority=2&provisionType=activate&lat=32.37436705")
+    CRM_INFO_BODY = "seqVal=%s&deviceId=%s"
+    DB_UPDATE_BODY = ("OM_ELIGIBILITY_STATUS=Eligible&appVersion=3.1.0&flag=failure&Radio_ID=%s"
+                      "&deviceID=%s&G_PLACES_REQUEST=&OS_Version=iPhone+12.5.7&G_PLACES_RESPONSE="
+                      "&Confirmation_Status=SUCCESS&seqVal=%s")
+    BLOCKLIST_BODY = "deviceId=%s"
+    CREATE_ACCOUNT_BODY = "seqVal=%s&deviceId=%s&oracleCXFailed=1&appVersion=3.1.0"
+    REFRESH_FOR_CC_BODY = ("deviceId=%s&provisionPriority=2&appVersion=3.1.0&device_Type=iPhone+iPhone+6+Plus"
+                           "&deviceID=%s&os_Version=iPhone+12.5.7&provisionType=activate")
 
     def __init__(self, config_file: str = "config.json", activation_log_file: str = "activation_log.json") -> None:
         self.config_file = config_file
         self.activation_log_file = activation_log_file
         self.config = self._load_or_create_config()
+        # Serialized form of what is on disk; lets _save_activation_log skip no-op writes.
+        self._activation_log_bytes: Optional[bytes] = None
+        self._log_dirty = False
+        self._pending_activations = 0
         self.activation_log = self._load_activation_log()
-        self.session = requests.Session()
         self.auth_token: Optional[str] = None
         self.sequence_value: Optional[str] = None
         # Persist the device ID for consistency between runs.
         self.device_id = self._get_or_create_device_id()
+        self.session = requests.Session()
+        # Reuse keep-alive connections across the workflow. Only retry failures to connect:
+        # the POSTs here (e.g. CreateAccount) are not safe to replay once the server has seen them.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Static headers live on the session; requests merges them with the per-call headers.
+        self.session.headers.update({
+            "Accept": "*/*",
+            "Accept-Language": "en-us",
+            "Accept-Encoding": "br, gzip, deflate",
+            "User-Agent": "SiriusXM Dealer/3.1.0 CFNetwork/1568.200.51 Darwin/24.1.0",
+            "X-Voltmx-API-Version": "1.0",
+            "X-Voltmx-DeviceId": self.device_id,
+            "Content-Type": "application/x-www-form-urlencoded",
+        })
 
     def _get_or_create_device_id(self) -> str:
-        if "device_id" in self.config:
-            return self.config["device_id"]
+        device_id = self.config.get("device_id")
+        if device_id:
+            return device_id
         new_device_id = str(uuid.uuid4())
         self.config["device_id"] = new_device_id
         self._save_config()
         return new_device_id
 
     def _load_or_create_config(self) -> Dict[str, Any]:
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, "r") as file:
-                    config = json.load(file)
-                    if "configurations" not in config or not isinstance(config["configurations"], list):
-                        raise ValueError("Missing or invalid 'configurations' list.")
-                    return config
-            except (json.JSONDecodeError, ValueError) as e:
-                logging.error("Error loading config file '%s': %s", self.config_file, e)
-                print(f"Error: Invalid configuration file '{self.config_file}': {e}")
+        try:
+            with open(self.config_file, "rb") as file:
+                config = orjson.loads(file.read())
+            if "configurations" not in config or not isinstance(config["configurations"], list):
+                raise ValueError("Missing or invalid 'configurations' list.")
+            return config
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, ValueError) as e:
+            logging.error("Error loading config file '%s': %s", self.config_file, e)
+            print(f"Error: Invalid configuration file '{self.config_file}': {e}")
         return {"configurations": []}
 
+    @staticmethod
+    def _write_atomic(path: str, payload: bytes) -> None:
+        """Write to a sibling temp file and rename it over `path` so readers never see a partial file."""
+        # No fsync: a crash may lose the latest write, but never leaves a truncated file behind.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(payload)
+        os.replace(tmp_path, path)
+
     def _save_config(self) -> None:
         try:
-            with open(self.config_file, "w") as file:
-                json.dump(self.config, file, indent=4)
+            self._write_atomic(self.config_file, orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
             logging.info("Configuration successfully saved to '%s'.", self.config_file)
         except IOError as e:
             logging.error("Failed to save configuration: %s", e)
             print(f"Error: Could not save configuration: {e}")
 
     def _load_activation_log(self) -> Dict[str, Any]:
-        if os.path.exists(self.activation_log_file):
-            try:
-                with open(self.activation_log_file, "r") as file:
-                    return json.load(file)
-            except (json.JSONDecodeError, ValueError) as e:
-                logging.error("Error loading activation log file '%s': %s", self.activation_log_file, e)
-                print(f"Error: Invalid activation log file '{self.activation_log_file}': {e}")
+        try:
+            with open(self.activation_log_file, "rb") as file:
+                activation_log = orjson.loads(file.read())
+            self._activation_log_bytes = orjson.dumps(activation_log, option=orjson.OPT_INDENT_2)
+            return activation_log
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, ValueError) as e:
+            logging.error("Error loading activation log file '%s': %s", self.activation_log_file, e)
+            print(f"Error: Invalid activation log file '{self.activation_log_file}': {e}")
         return {}
 
-    def _save_activation_log(self) -> None:
+    def _save_activation_log(self) -> bool:
+        """Persist the activation log; returns False if the write failed."""
+        payload = orjson.dumps(self.activation_log, option=orjson.OPT_INDENT_2)
+        if payload == self._activation_log_bytes:
+            logging.debug("Activation log unchanged; skipping save.")
+            return True
         try:
-            with open(self.activation_log_file, "w") as file:
-                json.dump(self.activation_log, file, indent=4)
+            self._write_atomic(self.activation_log_file, payload)
+            self._activation_log_bytes = payload
             logging.info("Activation log successfully saved to '%s'.", self.activation_log_file)
+            return True
         except IOError as e:
             logging.error("Failed to save activation log: %s", e)
             print(f"Error: Could not save activation log: {e}")
+            return False
 
     def add_configuration(self) -> Dict[str, str]:
         print("Adding a new configuration entry:")
@@ -114,16 +199,14 @@ class SiriusXMClient:
         if not self.config["configurations"]:
             print("No configurations available. Please add one.")
             return self.add_configuration()
-        print("Available configurations:")
+        log = self.activation_log
+        lines = ["Available configurations:"]
         for index, conf in enumerate(self.config["configurations"], start=1):
-            radio = conf["RadioID"]
-            if radio in self.activation_log:
-                status = "Activated"
-                last_act = self.activation_log[radio].get("last_activated", "N/A")
-            else:
-                status = "Not Activated"
-                last_act = "N/A"
-            print(f"{index}. {conf['Make']} {conf['Model']} ({conf['Year']}) - Radio ID: {radio} [{status} | Last: {last_act}]")
+            entry = log.get(conf["RadioID"])
+            status = "Activated" if entry is not None else "Not Activated"
+            last_act = format_timestamp((entry or {}).get("last_activated", "N/A"))
+            lines.append(f"{index}. {conf['Make']} {conf['Model']} ({conf['Year']}) - Radio ID: {conf['RadioID']} [{status} | Last: {last_act}]")
+        print("\n".join(lines))
         while True:
             try:
                 choice = int(input("Select a configuration by number (or 0 to add a new one): "))
@@ -137,39 +220,90 @@ class SiriusXMClient:
                 print("Invalid input. Please enter a numeric value.")
 
     def _build_default_headers(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        headers = {
-            "Accept": "*/*",
-            "Accept-Language": "en-us",
-            "Accept-Encoding": "br, gzip, deflate",
-            "User-Agent": "SiriusXM Dealer/3.1.0 CFNetwork/1568.200.51 Darwin/24.1.0",
-            "X-Voltmx-API-Version": "1.0",
-            "X-Voltmx-DeviceId": self.device_id,
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        """Return only the per-call headers; the static ones are already set on the session."""
+        headers = dict(extra_headers) if extra_headers else {}
         if self.auth_token:
             headers["X-Voltmx-Authorization"] = self.auth_token
-        if extra_headers:
-            headers.update(extra_headers)
         return headers
 
-    def _make_request(self, method: str, url: str, headers: Dict[str, str],
-                      data: Optional[Dict[str, Any]] = None,
-                      params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def _make_request(self, method: str, url: str, headers: Dict[str, Optional[str]],
+                      data: Optional[Union[bytes, Dict[str, Any]]] = None,
+                      params: Optional[Dict[str, Any]] = None,
+                      stream: bool = False) -> requests.Response:
         try:
-            response = self.session.request(method, url, headers=headers, data=data, params=params, timeout=self.REQUEST_TIMEOUT)
+            response = self.session.request(method, url, headers=headers, data=data, params=params,
+                                            timeout=self.REQUEST_TIMEOUT, stream=stream)
             response.raise_for_status()
             logging.info("Request to %s succeeded with status %s.", url, response.status_code)
             return response
         except RequestException as error:
+            # A streamed error response still holds its connection; give it back now rather
+            # than at garbage collection (the traceback on APIError keeps it alive until then).
+            if error.response is not None:
+                error.response.close()
             logging.error("Request to %s failed: %s", url, error)
             raise APIError(f"Request to {url} failed: {error}")
 
-    def _post(self, endpoint: str, data: Dict[str, Any],
+    def _post(self, endpoint: str, data: Union[bytes, Dict[str, Any]],
               extra_headers: Optional[Dict[str, str]] = None,
-              params: Optional[Dict[str, Any]] = None) -> requests.Response:
+              params: Optional[Dict[str, Any]] = None,
+              stream: bool = False) -> requests.Response:
         url = self.API_BASE_URL + endpoint if endpoint.startswith("/") else endpoint
         headers = self._build_default_headers(extra_headers)
-        return self._make_request("POST", url, headers=headers, data=data, params=params)
+        return self._make_request("POST", url, headers=headers, data=data, params=params, stream=stream)
+
+    @staticmethod
+    def _encode_form(template: str, *values: Optional[str]) -> bytes:
+        """Fill a pre-encoded form body template with URL-escaped values."""
+        return (template % tuple(quote_plus(value or "") for value in values)).encode("ascii")
+
+    @staticmethod
+    def _read_json_field(response: requests.Response, dotted_key: str) -> Any:
+        """Parse the response body with orjson and return the value at `dotted_key` (or None)."""
+        value: Any = orjson.loads(response.content)
+        for key in dotted_key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    def _run_step(self, title: str, endpoint: str, data: Union[bytes, Dict[str, Any]],
+                  response_label: str, error_message: str,
+                  params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, Optional[str]]] = None,
+                  announce: bool = True) -> None:
+        """Run a workflow step whose response body is only logged for debugging.
+
+        The request goes through _post with the default headers, or, when `headers` is given,
+        straight to the full URL in `endpoint` with exactly those headers. Pass announce=False
+        when running off the main thread so the step title doesn't interleave with its output.
+        """
+        if announce:
+            print(title)
+        try:
+            if headers is None:
+                response = self._post(endpoint, data=data, params=params, stream=True)
+            else:
+                response = self._make_request("POST", endpoint, headers=headers, data=data,
+                                              params=params, stream=True)
+            # The body is streamed: preview a prefix when debugging, then discard the rest in
+            # fixed-size chunks so the connection goes back to the pool without buffering it.
+            # urllib3 refuses to switch decode_content mid-body, so the drain decodes only when
+            # the preview did; otherwise compressed bodies are discarded without inflating them.
+            debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+            try:
+                if debug:
+                    preview = response.raw.read(self.DEBUG_PREVIEW_BYTES, decode_content=True)
+                    logging.debug("%s: %s", response_label, preview.decode(response.encoding or "utf-8", "replace"))
+                for _ in response.raw.stream(self.DRAIN_CHUNK_BYTES, decode_content=debug):
+                    pass
+            except (Urllib3Error, OSError) as error:
+                response.close()
+                logging.error("Reading response from %s failed: %s", response.url, error)
+                raise APIError(f"Request to {response.url} failed: {error}")
+        except APIError as e:
+            logging.error("%s: %s", error_message, e)
+            raise
 
     def login_user(self) -> None:
         print("User Login")
@@ -182,170 +316,104 @@ class SiriusXMClient:
         }
         try:
             response = self._post(self.LOGIN_ENDPOINT, data={}, extra_headers=extra_headers)
-            data_resp = response.json()
-            token = data_resp.get("claims_token", {}).get("value")
+            token = self._read_json_field(response, "claims_token.value")
             if token:
                 self.auth_token = token
                 logging.info("User successfully authenticated.")
                 print("✓ Login successful.")
             else:
                 raise APIError("Authentication token missing in response.")
-        except (APIError, json.JSONDecodeError) as error:
+        except (APIError, orjson.JSONDecodeError) as error:
             logging.error("Failed to login: %s", error)
             print("✗ Error: Could not process login response.")
             raise
 
-    def perform_version_check(self) -> None:
-        print("Version Check")
-        data = {
-            "deviceCategory": "iPhone",
-            "appver": "3.1.0",
-            "deviceLocale": "en_US",
-            "deviceModel": "iPhone 6 Plus",
-            "deviceVersion": "12.5.7",
-            "deviceType": "",
-        }
-        try:
-            response = self._post(self.VERSION_CONTROL_ENDPOINT, data=data)
-            logging.debug("Version check response: %s", response.text)
-        except APIError as e:
-            logging.error("Version check failed: %s", e)
-            raise
+    def perform_version_check(self, announce: bool = True) -> None:
+        self._run_step("Version Check", self.VERSION_CONTROL_ENDPOINT, self.VERSION_CHECK_BODY,
+                       "Version check response", "Version check failed", announce=announce)
 
-    def retrieve_device_properties(self) -> None:
-        print("Retrieve Device Properties")
-        try:
-            response = self._post(self.GET_PROPERTIES_ENDPOINT, data={})
-            logging.debug("Device properties response: %s", response.text)
-        except APIError as e:
-            logging.error("Failed to retrieve device properties: %s", e)
-            raise
+    def retrieve_device_properties(self, announce: bool = True) -> None:
+        self._run_step("Retrieve Device Properties", self.GET_PROPERTIES_ENDPOINT, b"",
+                       "Device properties response", "Failed to retrieve device properties", announce=announce)
 
     def update_device_status(self, radio_id: str) -> None:
         print("Update Device Status (SAT Refresh)")
-        data = {
-            "deviceId": radio_id,
-            "appVersion": "3.1.0",
-            "lng": "-86.210313195",
-            "deviceID": self.device_id,
-            "provisionPriority": "2",
-            "provisionType": "activate",
-            "lat": "32.37436705",
-        }
+        data = self._encode_form(self.SAT_REFRESH_BODY, radio_id, self.device_id)
         try:
             response = self._post(self.SAT_REFRESH_ENDPOINT, data=data)
-            resp_json = response.json()
-            self.sequence_value = resp_json.get("seqValue")
+            self.sequence_value = self._read_json_field(response, "seqValue")
             if self.sequence_value:
                 logging.info("Sequence value retrieved: %s", self.sequence_value)
                 print("✓ Device status updated successfully.")
             else:
                 raise APIError("Missing sequence value in response.")
-        except (APIError, json.JSONDecodeError) as e:
+        except (APIError, orjson.JSONDecodeError) as e:
             logging.error("Failed to update device status: %s", e)
             print("✗ Error: Device update response could not be processed.")
             raise
 
     def fetch_crm_information(self, radio_id: str) -> None:
-        print("Retrieve CRM Account Plan Information")
-        data = {"seqVal": self.sequence_value, "deviceId": radio_id}
-        try:
-            response = self._post(self.CRM_INFO_ENDPOINT, data=data)
-            logging.debug("CRM information response: %s", response.text)
-        except APIError as e:
-            logging.error("Failed to fetch CRM information: %s", e)
-            raise
+        data = self._encode_form(self.CRM_INFO_BODY, self.sequence_value, radio_id)
+        self._run_step("Retrieve CRM Account Plan Information", self.CRM_INFO_ENDPOINT, data,
+                       "CRM information response", "Failed to fetch CRM information")
 
     def update_google_database(self, radio_id: str) -> None:
-        print("Update Google Database")
-        data = {
-            "OM_ELIGIBILITY_STATUS": "Eligible",
-            "appVersion": "3.1.0",
-            "flag": "failure",
-            "Radio_ID": radio_id,
-            "deviceID": self.device_id,
-            "G_PLACES_REQUEST": "",
-            "OS_Version": "iPhone 12.5.7",
-            "G_PLACES_RESPONSE": "",
-            "Confirmation_Status": "SUCCESS",
-            "seqVal": self.sequence_value,
-        }
-        try:
-            response = self._post(self.DB_UPDATE_ENDPOINT, data=data)
-            logging.debug("Google database update response: %s", response.text)
-        except APIError as e:
-            logging.error("Failed to update Google database: %s", e)
-            raise
+        data = self._encode_form(self.DB_UPDATE_BODY, radio_id, self.device_id, self.sequence_value)
+        self._run_step("Update Google Database", self.DB_UPDATE_ENDPOINT, data,
+                       "Google database update response", "Failed to update Google database")
 
     def block_device(self) -> None:
-        print("Block Device")
-        data = {"deviceId": self.device_id}
-        try:
-            response = self._post(self.BLOCKLIST_ENDPOINT, data=data)
-            logging.debug("Device block response: %s", response.text)
-        except APIError as e:
-            logging.error("Failed to block device: %s", e)
-            raise
+        data = self._encode_form(self.BLOCKLIST_BODY, self.device_id)
+        self._run_step("Block Device", self.BLOCKLIST_ENDPOINT, data,
+                       "Device block response", "Failed to block device")
 
-    def perform_oracle_check(self) -> None:
-        print("Oracle Program Status Check")
+    def perform_oracle_check(self, announce: bool = True) -> None:
         params = {"google_addr": "395 EASTERN BLVD, MONTGOMERY, AL 36117, USA"}
-        try:
-            # ORACLE_URL is a full URL so we use _make_request directly.
-            headers = self._build_default_headers({"Content-Type": "application/x-www-form-urlencoded"})
-            response = self._make_request("POST", self.ORACLE_URL, headers=headers, data={}, params=params)
-            logging.debug("Oracle program status response: %s", response.text)
-        except APIError as e:
-            logging.error("Oracle check failed: %s", e)
-            raise
+        # ORACLE_URL is a different host, so skip the Voltmx headers and auth token entirely.
+        self._run_step("Oracle Program Status Check", self.ORACLE_URL, b"",
+                       "Oracle program status response", "Oracle check failed",
+                       params=params, headers=self.ORACLE_HEADERS, announce=announce)
 
     def create_new_account(self, radio_id: str) -> None:
-        print("Create New Account")
-        data = {
-            "seqVal": self.sequence_value,
-            "deviceId": radio_id,
-            "oracleCXFailed": "1",
-            "appVersion": "3.1.0",
-        }
-        try:
-            response = self._post(self.CREATE_ACCOUNT_ENDPOINT, data=data)
-            logging.debug("Account creation response: %s", response.text)
-        except APIError as e:
-            logging.error("Account creation failed: %s", e)
-            raise
+        data = self._encode_form(self.CREATE_ACCOUNT_BODY, self.sequence_value, radio_id)
+        self._run_step("Create New Account", self.CREATE_ACCOUNT_ENDPOINT, data,
+                       "Account creation response", "Account creation failed")
 
     def refresh_device_status_for_cc(self, radio_id: str) -> None:
-        print("Refresh Device Status for CC")
-        data = {
-            "deviceId": radio_id,
-            "provisionPriority": "2",
-            "appVersion": "3.1.0",
-            "device_Type": "iPhone iPhone 6 Plus",
-            "deviceID": self.device_id,
-            "os_Version": "iPhone 12.5.7",
-            "provisionType": "activate",
-        }
-        try:
-            response = self._post(self.REFRESH_FOR_CC_ENDPOINT, data=data)
-            logging.debug("Device status refresh for CC response: %s", response.text)
-        except APIError as e:
-            logging.error("Refresh device status for CC failed: %s", e)
-            raise
+        data = self._encode_form(self.REFRESH_FOR_CC_BODY, radio_id, self.device_id)
+        self._run_step("Refresh Device Status for CC", self.REFRESH_FOR_CC_ENDPOINT, data,
+                       "Device status refresh for CC response", "Refresh device status for CC failed")
+
+    def flush_activation_log(self) -> None:
+        """Write buffered activation log changes to disk, if there are any."""
+        if not self._log_dirty:
+            return
+        # Stay dirty on failure so the next flush (or the one at exit) retries the write.
+        if self._save_activation_log():
+            self._log_dirty = False
+            self._pending_activations = 0
 
     def mark_configuration_as_activated(self, configuration: Dict[str, str]) -> None:
-        """Mark the configuration as activated and record the activation timestamp (ISO 8601)."""
-        timestamp = datetime.now().isoformat()
+        """Mark the configuration as activated and record the activation timestamp (epoch seconds)."""
+        timestamp = int(time.time())
         radio = configuration["RadioID"]
         self.activation_log[radio] = {"activated": True, "last_activated": timestamp}
-        self._save_activation_log()
-        logging.info("Configuration for Radio ID %s marked as activated on %s", radio, timestamp)
-        print(f"Configuration marked as activated on {timestamp}")
+        self._log_dirty = True
+        self._pending_activations += 1
+        if self._pending_activations >= self.ACTIVATION_LOG_FLUSH_EVERY:
+            self.flush_activation_log()
+        display_time = format_timestamp(timestamp)
+        logging.info("Configuration for Radio ID %s marked as activated on %s", radio, display_time)
+        print(f"Configuration marked as activated on {display_time}")
 
 def main() -> None:
     logging.info("================================================")
-    logging.info("New run started at: %s", datetime.now().strftime("%Y-%m-%dT%H:%M:%S"))
+    logging.info("New run started at: %s", time.strftime("%Y-%m-%dT%H:%M:%S"))
     
     client = SiriusXMClient()
+    # Buffered activations must reach disk however the program ends; the log is what
+    # warns before a re-activation.
+    atexit.register(client.flush_activation_log)
     
     while True:
         try:
@@ -353,8 +421,9 @@ def main() -> None:
             radio_id = selected_config["RadioID"]
             print(f"Selected configuration: {selected_config['Make']} {selected_config['Model']} ({selected_config['Year']}) - Radio ID: {radio_id}")
         
-            if radio_id in client.activation_log:
-                last_act = client.activation_log[radio_id].get("last_activated", "unknown")
+            entry = client.activation_log.get(radio_id)
+            if entry is not None:
+                last_act = format_timestamp(entry.get("last_activated", "unknown"))
                 print(f"This configuration was already activated on {last_act}.")
                 choice = input("Do you want to force reactivation? (y/N): ").strip().lower()
                 if choice != "y":
@@ -365,13 +434,22 @@ def main() -> None:
             print("Starting the SiriusXM API workflow...")
             try:
                 client.login_user()
-                client.perform_version_check()
-                client.retrieve_device_properties()
-                client.update_device_status(radio_id)
-                client.fetch_crm_information(radio_id)
-                client.update_google_database(radio_id)
-                client.block_device()
-                client.perform_oracle_check()
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    # These checks don't feed the SAT/CRM chain, so run them alongside it. They stay
+                    # silent in the workers; their outcome is reported once they have been joined.
+                    print("Version Check, Retrieve Device Properties and Oracle Program Status Check (in background)")
+                    side_checks = [
+                        executor.submit(client.perform_version_check, announce=False),
+                        executor.submit(client.retrieve_device_properties, announce=False),
+                        executor.submit(client.perform_oracle_check, announce=False),
+                    ]
+                    client.update_device_status(radio_id)
+                    client.fetch_crm_information(radio_id)
+                    client.update_google_database(radio_id)
+                    client.block_device()
+                    for future in side_checks:
+                        future.result()
+                    print("✓ Background checks completed.")
                 client.create_new_account(radio_id)
                 client.refresh_device_status_for_cc(radio_id)
                 client.mark_configuration_as_activated(selected_config)
@@ -384,7 +462,8 @@ def main() -> None:
             break
 
 if __name__ == "__main__":
-    # Configure logging with a rotating file handler.
+    # Configure logging with a rotating file handler, fed through a queue so that
+    # disk writes happen on a background thread instead of the request thread.
     log_formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
     log_file = "activation.log"
     handler = RotatingFileHandler(log_file, mode='a', maxBytes=5 * 1024 * 1024,
@@ -392,8 +471,19 @@ if __name__ == "__main__":
     handler.setFormatter(log_formatter)
     handler.setLevel(logging.INFO)
 
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+    # Turn termination signals (e.g. stopping the Replit or closing the terminal)
+    # into a normal exit so the atexit handlers still run.
+    for sig_name in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, sig_name):
+            signal.signal(getattr(signal, sig_name), lambda signum, frame: sys.exit(128 + signum))
     
     main()